@@ -4,11 +4,27 @@ import json
 import os
 import re
 import shutil
+import time
 from pathlib import Path
 
 # Default builtin skills directory (relative to this file)
 BUILTIN_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
+# PATH lookups for skill requirements, re-checked after a short TTL so newly installed CLIs show up
+WHICH_CACHE_TTL_S = 60.0
+_which_cache: dict[str, tuple[float, str | None]] = {}
+
+
+def _which(binary: str) -> str | None:
+    """Cached shutil.which() for skill requirement checks."""
+    now = time.monotonic()
+    hit = _which_cache.get(binary)
+    if hit and now - hit[0] < WHICH_CACHE_TTL_S:
+        return hit[1]
+    path = shutil.which(binary)
+    _which_cache[binary] = (now, path)
+    return path
+
 
 class SkillsLoader:
     """
@@ -22,6 +38,7 @@ class SkillsLoader:
         self.workspace = workspace
         self.workspace_skills = workspace / "skills"
         self.builtin_skills = builtin_skills_dir or BUILTIN_SKILLS_DIR
+        self._content_cache: dict[Path, tuple[tuple[int, int, int], str]] = {}  # path -> (stat key, content)
     
     def list_skills(self, filter_unavailable: bool = True) -> list[dict[str, str]]:
         """
@@ -67,18 +84,32 @@ class SkillsLoader:
             Skill content or None if not found.
         """
         # Check workspace first
-        workspace_skill = self.workspace_skills / name / "SKILL.md"
-        if workspace_skill.exists():
-            return workspace_skill.read_text(encoding="utf-8")
+        content = self._read_skill_file(self.workspace_skills / name / "SKILL.md")
+        if content is not None:
+            return content
         
         # Check built-in
         if self.builtin_skills:
-            builtin_skill = self.builtin_skills / name / "SKILL.md"
-            if builtin_skill.exists():
-                return builtin_skill.read_text(encoding="utf-8")
+            return self._read_skill_file(self.builtin_skills / name / "SKILL.md")
         
         return None
     
+    def _read_skill_file(self, path: Path) -> str | None:
+        """Read a SKILL.md, reusing the cached text while the file looks unchanged."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        # mtime alone misses edits within the filesystem's timestamp granularity;
+        # size and inode catch most of those (and atomic replace-style saves)
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        hit = self._content_cache.get(path)
+        if hit and hit[0] == key:
+            return hit[1]
+        content = path.read_text(encoding="utf-8")
+        self._content_cache[path] = (key, content)
+        return content
+    
     def load_skills_for_context(self, skill_names: list[str]) -> str:
         """
         Load specific skills for inclusion in agent context.
@@ -119,9 +150,12 @@ class SkillsLoader:
         for s in all_skills:
             name = escape_xml(s["name"])
             path = s["path"]
-            desc = escape_xml(self._get_skill_description(s["name"]))
-            skill_meta = self._get_skill_meta(s["name"])
-            available = self._check_requirements(skill_meta)
+            # Read the frontmatter once for both description and requirements
+            meta = self.get_skill_metadata(s["name"]) or {}
+            desc = escape_xml(meta.get("description") or s["name"])
+            skill_meta = self._parse_nanobot_metadata(meta.get("metadata", ""))
+            missing = self._get_missing_requirements(skill_meta)
+            available = not missing
             
             lines.append(f"  <skill available=\"{str(available).lower()}\">")
             lines.append(f"    <name>{name}</name>")
@@ -129,10 +163,8 @@ class SkillsLoader:
             lines.append(f"    <location>{path}</location>")
             
             # Show missing requirements for unavailable skills
-            if not available:
-                missing = self._get_missing_requirements(skill_meta)
-                if missing:
-                    lines.append(f"    <requires>{escape_xml(missing)}</requires>")
+            if missing:
+                lines.append(f"    <requires>{escape_xml(missing)}</requires>")
             
             lines.append(f"  </skill>")
         lines.append("</skills>")
@@ -144,20 +176,13 @@ class SkillsLoader:
         missing = []
         requires = skill_meta.get("requires", {})
         for b in requires.get("bins", []):
-            if not shutil.which(b):
+            if not _which(b):
                 missing.append(f"CLI: {b}")
         for env in requires.get("env", []):
             if not os.environ.get(env):
                 missing.append(f"ENV: {env}")
         return ", ".join(missing)
     
-    def _get_skill_description(self, name: str) -> str:
-        """Get the description of a skill from its frontmatter."""
-        meta = self.get_skill_metadata(name)
-        if meta and meta.get("description"):
-            return meta["description"]
-        return name  # Fallback to skill name
-    
     def _strip_frontmatter(self, content: str) -> str:
         """Remove YAML frontmatter from markdown content."""
         if content.startswith("---"):
@@ -176,14 +201,7 @@ class SkillsLoader:
     
     def _check_requirements(self, skill_meta: dict) -> bool:
         """Check if skill requirements are met (bins, env vars)."""
-        requires = skill_meta.get("requires", {})
-        for b in requires.get("bins", []):
-            if not shutil.which(b):
-                return False
-        for env in requires.get("env", []):
-            if not os.environ.get(env):
-                return False
-        return True
+        return not self._get_missing_requirements(skill_meta)
     
     def _get_skill_meta(self, name: str) -> dict:
         """Get nanobot metadata for a skill (cached in frontmatter)."""
@@ -193,10 +211,10 @@ class SkillsLoader:
     def get_always_skills(self) -> list[str]:
         """Get skills marked as always=true that meet requirements."""
         result = []
-        for s in self.list_skills(filter_unavailable=True):
+        for s in self.list_skills(filter_unavailable=False):
             meta = self.get_skill_metadata(s["name"]) or {}
             skill_meta = self._parse_nanobot_metadata(meta.get("metadata", ""))
-            if skill_meta.get("always") or meta.get("always"):
+            if (skill_meta.get("always") or meta.get("always")) and self._check_requirements(skill_meta):
                 result.append(s["name"])
         return result
     
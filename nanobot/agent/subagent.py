@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-import uuid
+import secrets
 from pathlib import Path
 from typing import Any
 
@@ -69,7 +69,7 @@ class SubagentManager:
         Returns:
             Status message indicating the subagent was started.
         """
-        task_id = str(uuid.uuid4())[:8]
+        task_id = secrets.token_hex(4)
         display_label = label or task[:30] + ("..." if len(task) > 30 else "")
         
         origin = {
@@ -4,6 +4,8 @@ import html
 import json
 import os
 import re
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any
 from urllib.parse import urlparse
 
@@ -14,6 +16,32 @@ from nanobot.agent.tools.base import Tool
 # Shared constants
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
 MAX_REDIRECTS = 5  # Limit redirects to prevent DoS attacks
+SEARCH_CACHE_TTL_S = 60.0  # Repeat searches within this window are served from memory
+SEARCH_CACHE_MAX_AGE_S = 300.0  # Entries older than this are evicted on insert
+
+# Shared connection pool so repeated searches/fetches skip the TCP + TLS handshake
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the pooled client for web tools, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            max_redirects=MAX_REDIRECTS,
+            # Shared across chats and users, so never store or replay cookies
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=50, keepalive_expiry=60.0),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the pooled web client (call on application shutdown)."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
 
 
 def _strip_tags(text: str) -> str:
@@ -60,21 +88,27 @@ class WebSearchTool(Tool):
     def __init__(self, api_key: str | None = None, max_results: int = 5):
         self.api_key = api_key or os.environ.get("BRAVE_API_KEY", "")
         self.max_results = max_results
+        self._cache: dict[tuple[str, int], tuple[float, str]] = {}  # (query, count) -> (fetched_at, result)
     
     async def execute(self, query: str, count: int | None = None, **kwargs: Any) -> str:
         if not self.api_key:
             return "Error: BRAVE_API_KEY not configured"
         
+        n = min(max(count or self.max_results, 1), 10)
+        key = (query, n)
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit and now - hit[0] < SEARCH_CACHE_TTL_S:
+            return hit[1]
+        
         try:
-            n = min(max(count or self.max_results, 1), 10)
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": n},
-                    headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
-                    timeout=10.0
-                )
-                r.raise_for_status()
+            r = await _get_client().get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": query, "count": n},
+                headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
+                timeout=10.0
+            )
+            r.raise_for_status()
             
             results = r.json().get("web", {}).get("results", [])
             if not results:
@@ -85,9 +119,13 @@ class WebSearchTool(Tool):
                 lines.append(f"{i}. {item.get('title', '')}\n   {item.get('url', '')}")
                 if desc := item.get("description"):
                     lines.append(f"   {desc}")
-            return "\n".join(lines)
+            text = "\n".join(lines)
         except Exception as e:
             return f"Error: {e}"
+        
+        self._cache = {k: v for k, v in self._cache.items() if now - v[0] < SEARCH_CACHE_MAX_AGE_S}
+        self._cache[key] = (now, text)
+        return text
 
 
 class WebFetchTool(Tool):
@@ -119,13 +157,13 @@ class WebFetchTool(Tool):
             return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url})
 
         try:
-            async with httpx.AsyncClient(
+            r = await _get_client().get(
+                url,
+                headers={"User-Agent": USER_AGENT},
                 follow_redirects=True,
-                max_redirects=MAX_REDIRECTS,
                 timeout=30.0
-            ) as client:
-                r = await client.get(url, headers={"User-Agent": USER_AGENT})
-                r.raise_for_status()
+            )
+            r.raise_for_status()
             
             ctype = r.headers.get("content-type", "")
             
@@ -164,7 +164,7 @@ class DingTalkChannel(BaseChannel):
 
     async def _get_access_token(self) -> str | None:
         """Get or refresh Access Token."""
-        if self._access_token and time.time() < self._token_expiry:
+        if self._access_token and time.monotonic() < self._token_expiry:
             return self._access_token
 
         url = "https://api.dingtalk.com/v1.0/oauth2/accessToken"
@@ -182,8 +182,8 @@ class DingTalkChannel(BaseChannel):
             resp.raise_for_status()
             res_data = resp.json()
             self._access_token = res_data.get("accessToken")
-            # Expire 60s early to be safe
-            self._token_expiry = time.time() + int(res_data.get("expireIn", 7200)) - 60
+            # Expire 60s early to be safe; monotonic so wall-clock jumps can't extend or cut it short
+            self._token_expiry = time.monotonic() + int(res_data.get("expireIn", 7200)) - 60
             return self._access_token
         except Exception as e:
             logger.error(f"Failed to get DingTalk access token: {e}")
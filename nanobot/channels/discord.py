@@ -13,6 +13,7 @@ from nanobot.bus.events import OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import DiscordConfig
+from nanobot.utils.helpers import backoff_delay
 
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
@@ -32,6 +33,7 @@ class DiscordChannel(BaseChannel):
         self._heartbeat_task: asyncio.Task | None = None
         self._typing_tasks: dict[str, asyncio.Task] = {}
         self._http: httpx.AsyncClient | None = None
+        self._ready = False
 
     async def start(self) -> None:
         """Start the Discord gateway connection."""
@@ -41,20 +43,33 @@ class DiscordChannel(BaseChannel):
 
         self._running = True
         self._http = httpx.AsyncClient(timeout=30.0)
+        attempt = 0
 
         while self._running:
+            self._ready = False
+            clean_exit = False
             try:
                 logger.info("Connecting to Discord gateway...")
                 async with websockets.connect(self.config.gateway_url) as ws:
                     self._ws = ws
                     await self._gateway_loop()
+                    clean_exit = True
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.warning(f"Discord gateway error: {e}")
-                if self._running:
-                    logger.info("Reconnecting to Discord gateway in 5 seconds...")
-                    await asyncio.sleep(5)
+
+            # Only a session that reached READY counts as a successful connect; a gateway
+            # that accepts the socket and then drops it (bad token, restart loop) keeps backing off
+            if self._ready:
+                attempt = 0
+                if clean_exit:
+                    continue  # Gateway asked a live session to reconnect
+            if self._running:
+                delay = backoff_delay(attempt, 5)
+                attempt += 1
+                logger.info(f"Reconnecting to Discord gateway in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
 
     async def stop(self) -> None:
         """Stop the Discord channel."""
@@ -134,6 +149,7 @@ class DiscordChannel(BaseChannel):
                 await self._identify()
             elif op == 0 and event_type == "READY":
                 logger.info("Discord gateway READY")
+                self._ready = True
             elif op == 0 and event_type == "MESSAGE_CREATE":
                 await self._handle_message_create(payload)
             elif op == 7:
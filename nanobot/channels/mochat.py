@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -16,7 +18,7 @@ from nanobot.bus.events import OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import MochatConfig
-from nanobot.utils.helpers import get_data_path
+from nanobot.utils.helpers import backoff_delay, get_data_path
 
 try:
     import socketio
@@ -33,6 +35,8 @@ except ImportError:
 
 MAX_SEEN_MESSAGE_IDS = 2000
 CURSOR_SAVE_DEBOUNCE_S = 0.5
+WATCH_FAST_RETURN_S = 1.0  # Empty watch replies faster than this mean the server is not long-polling
+WATCH_FAST_RETURN_LIMIT = 3
 
 
 # ---------------------------------------------------------------------------
@@ -221,6 +225,8 @@ class MochatChannel(BaseChannel):
         super().__init__(config, bus)
         self.config: MochatConfig = config
         self._http: httpx.AsyncClient | None = None
+        self._api_base = config.base_url.strip().rstrip("/")
+        self._api_headers = {"Content-Type": "application/json", "X-Claw-Token": config.claw_token}
         self._socket: Any = None
         self._ws_connected = self._ws_ready = False
 
@@ -588,18 +594,32 @@ class MochatChannel(BaseChannel):
         self._panel_fallback_tasks.clear()
 
     async def _session_watch_worker(self, session_id: str) -> None:
+        retry_base_s = max(0.1, self.config.retry_delay_ms / 1000.0)
+        # Keep the request open a bit longer than the server-side hold
+        request_timeout = httpx.Timeout(self.config.watch_timeout_ms / 1000.0 + 10.0, connect=10.0)
+        attempt = fast_returns = 0
         while self._running and self._fallback_mode:
             try:
+                started = time.monotonic()
                 payload = await self._post_json("/api/claw/sessions/watch", {
                     "sessionId": session_id, "cursor": self._session_cursor.get(session_id, 0),
                     "timeoutMs": self.config.watch_timeout_ms, "limit": self.config.watch_limit,
-                })
+                }, timeout=request_timeout)
+                attempt = 0
                 await self._handle_watch_payload(payload, "session")
+                # Re-issue immediately; only back off if the server keeps answering empty right away
+                if payload.get("events") or time.monotonic() - started >= WATCH_FAST_RETURN_S:
+                    fast_returns = 0
+                else:
+                    fast_returns += 1
+                    if fast_returns >= WATCH_FAST_RETURN_LIMIT:
+                        await asyncio.sleep(retry_base_s)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.warning(f"Mochat watch fallback error ({session_id}): {e}")
-                await asyncio.sleep(max(0.1, self.config.retry_delay_ms / 1000.0))
+                await asyncio.sleep(backoff_delay(attempt, retry_base_s))
+                attempt += 1
 
     async def _panel_poll_worker(self, panel_id: str) -> None:
         sleep_s = max(1.0, self.config.refresh_interval_ms / 1000.0)
@@ -847,22 +867,24 @@ class MochatChannel(BaseChannel):
     async def _save_session_cursors(self) -> None:
         try:
             self._state_dir.mkdir(parents=True, exist_ok=True)
-            self._cursor_path.write_text(json.dumps({
+            # Compact JSON via temp file + rename so a crash never leaves a torn cursor file
+            tmp_path = self._cursor_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps({
                 "schemaVersion": 1, "updatedAt": datetime.utcnow().isoformat(),
                 "cursors": self._session_cursor,
-            }, ensure_ascii=False, indent=2) + "\n", "utf-8")
+            }, ensure_ascii=False, separators=(",", ":")) + "\n", "utf-8")
+            os.replace(tmp_path, self._cursor_path)
         except Exception as e:
             logger.warning(f"Failed to save Mochat cursor file: {e}")
 
     # ---- HTTP helpers ------------------------------------------------------
 
-    async def _post_json(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+    async def _post_json(self, path: str, payload: dict[str, Any],
+                         timeout: httpx.Timeout | None = None) -> dict[str, Any]:
         if not self._http:
             raise RuntimeError("Mochat HTTP client not initialized")
-        url = f"{self.config.base_url.strip().rstrip('/')}{path}"
-        response = await self._http.post(url, headers={
-            "Content-Type": "application/json", "X-Claw-Token": self.config.claw_token,
-        }, json=payload)
+        response = await self._http.post(f"{self._api_base}{path}", headers=self._api_headers,
+                                          json=payload, timeout=timeout or self._http.timeout)
         if not response.is_success:
             raise RuntimeError(f"Mochat HTTP {response.status_code}: {response.text[:200]}")
         try:
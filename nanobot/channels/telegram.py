@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import re
+from typing import TYPE_CHECKING
+
 from loguru import logger
 from telegram import BotCommand, Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
@@ -14,6 +16,9 @@ from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import TelegramConfig
 
+if TYPE_CHECKING:
+    from nanobot.providers.transcription import GroqTranscriptionProvider
+
 
 def _markdown_to_telegram_html(text: str) -> str:
     """
@@ -126,6 +131,7 @@ class TelegramChannel(BaseChannel):
         self._app: Application | None = None
         self._chat_ids: dict[str, int] = {}  # Map sender_id to chat_id for replies
         self._typing_tasks: dict[str, asyncio.Task] = {}  # chat_id -> typing loop task
+        self._transcriber: GroqTranscriptionProvider | None = None  # Reused so its connection pool is too
     
     async def start(self) -> None:
         """Start the Telegram bot with long polling."""
@@ -197,6 +203,10 @@ class TelegramChannel(BaseChannel):
             await self._app.stop()
             await self._app.shutdown()
             self._app = None
+        
+        if self._transcriber:
+            await self._transcriber.aclose()
+            self._transcriber = None
     
     @staticmethod
     def _get_media_type(path: str) -> str:
@@ -340,9 +350,10 @@ class TelegramChannel(BaseChannel):
                 
                 # Handle voice transcription
                 if media_type == "voice" or media_type == "audio":
-                    from nanobot.providers.transcription import GroqTranscriptionProvider
-                    transcriber = GroqTranscriptionProvider(api_key=self.groq_api_key)
-                    transcription = await transcriber.transcribe(file_path)
+                    if self._transcriber is None:
+                        from nanobot.providers.transcription import GroqTranscriptionProvider
+                        self._transcriber = GroqTranscriptionProvider(api_key=self.groq_api_key)
+                    transcription = await self._transcriber.transcribe(file_path)
                     if transcription:
                         logger.info(f"Transcribed {media_type}: {transcription[:50]}...")
                         content_parts.append(f"[transcription: {transcription}]")
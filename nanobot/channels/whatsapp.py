@@ -10,6 +10,7 @@ from nanobot.bus.events import OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import WhatsAppConfig
+from nanobot.utils.helpers import backoff_delay
 
 
 class WhatsAppChannel(BaseChannel):
@@ -37,6 +38,7 @@ class WhatsAppChannel(BaseChannel):
         logger.info(f"Connecting to WhatsApp bridge at {bridge_url}...")
         
         self._running = True
+        attempt = 0
         
         while self._running:
             try:
@@ -50,6 +52,9 @@ class WhatsAppChannel(BaseChannel):
                     
                     # Listen for messages
                     async for message in ws:
+                        # The bridge closes unauthenticated sockets straight away, so the first
+                        # message (not the open socket) marks a working session
+                        attempt = 0
                         try:
                             await self._handle_bridge_message(message)
                         except Exception as e:
@@ -58,13 +63,15 @@ class WhatsAppChannel(BaseChannel):
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self._connected = False
-                self._ws = None
                 logger.warning(f"WhatsApp bridge connection error: {e}")
-                
-                if self._running:
-                    logger.info("Reconnecting in 5 seconds...")
-                    await asyncio.sleep(5)
+            
+            self._connected = False
+            self._ws = None
+            if self._running:
+                delay = backoff_delay(attempt, 5)
+                attempt += 1
+                logger.info(f"Reconnecting in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
     
     async def stop(self) -> None:
         """Stop the WhatsApp channel."""
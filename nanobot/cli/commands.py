@@ -336,6 +336,8 @@ def gateway(
     from nanobot.cron.service import CronService
     from nanobot.cron.types import CronJob
     from nanobot.heartbeat.service import HeartbeatService
+    from nanobot.providers.openai_codex_provider import aclose as close_codex_clients
+    from nanobot.agent.tools.web import aclose as close_web_client
     
     if verbose:
         import logging
@@ -431,6 +433,8 @@ def gateway(
             cron.stop()
             agent.stop()
             await channels.stop_all()
+            await close_codex_clients()
+            await close_web_client()
     
     asyncio.run(run())
 
@@ -454,6 +458,8 @@ def agent(
     from nanobot.bus.queue import MessageBus
     from nanobot.agent.loop import AgentLoop
     from nanobot.cron.service import CronService
+    from nanobot.providers.openai_codex_provider import aclose as close_codex_clients
+    from nanobot.agent.tools.web import aclose as close_web_client
     from loguru import logger
     
     config = load_config()
@@ -504,6 +510,8 @@ def agent(
                 response = await agent_loop.process_direct(message, session_id, on_progress=_cli_progress)
             _print_agent_response(response, render_markdown=markdown)
             await agent_loop.close_mcp()
+            await close_codex_clients()
+            await close_web_client()
         
         asyncio.run(run_once())
     else:
@@ -546,6 +554,8 @@ def agent(
                         break
             finally:
                 await agent_loop.close_mcp()
+                await close_codex_clients()
+                await close_web_client()
         
         asyncio.run(run_interactive())
 
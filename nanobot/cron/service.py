@@ -2,8 +2,9 @@
 
 import asyncio
 import json
+import os
+import secrets
 import time
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Coroutine
@@ -14,7 +15,7 @@ from nanobot.cron.types import CronJob, CronJobState, CronPayload, CronSchedule,
 
 
 def _now_ms() -> int:
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def _compute_next_run(schedule: CronSchedule, now_ms: int) -> int | None:
@@ -148,7 +149,10 @@ class CronService:
             ]
         }
         
-        self.store_path.write_text(json.dumps(data, indent=2))
+        # Write to a sibling file and swap it in so a crash never leaves a torn jobs.json
+        tmp_path = self.store_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.store_path)
     
     async def start(self) -> None:
         """Start the cron service."""
@@ -275,7 +279,7 @@ class CronService:
         now = _now_ms()
         
         job = CronJob(
-            id=str(uuid.uuid4())[:8],
+            id=secrets.token_hex(4),
             name=name,
             enabled=True,
             schedule=schedule,
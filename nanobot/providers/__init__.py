@@ -1,7 +1,24 @@
 """LLM provider abstraction module."""
 
+from typing import TYPE_CHECKING
+
 from nanobot.providers.base import LLMProvider, LLMResponse
-from nanobot.providers.litellm_provider import LiteLLMProvider
-from nanobot.providers.openai_codex_provider import OpenAICodexProvider
+
+if TYPE_CHECKING:
+    from nanobot.providers.litellm_provider import LiteLLMProvider
+    from nanobot.providers.openai_codex_provider import OpenAICodexProvider
 
 __all__ = ["LLMProvider", "LLMResponse", "LiteLLMProvider", "OpenAICodexProvider"]
+
+# Backends pull in heavy SDKs (litellm alone takes seconds to import), so load them on first access
+_LAZY_IMPORTS = {
+    "LiteLLMProvider": "nanobot.providers.litellm_provider",
+    "OpenAICodexProvider": "nanobot.providers.openai_codex_provider",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
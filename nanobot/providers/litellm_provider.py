@@ -38,6 +38,9 @@ class LiteLLMProvider(LLMProvider):
         # api_key / api_base are fallback for auto-detection.
         self._gateway = find_gateway(provider_name, api_key, api_base)
         
+        # The default model is used on nearly every call; resolve its prefix once
+        self._resolved_default_model = self._resolve_model(default_model)
+        
         # Configure environment variables
         if api_key:
             self._setup_env(api_key, api_base, default_model)
@@ -124,7 +127,11 @@ class LiteLLMProvider(LLMProvider):
         Returns:
             LLMResponse with content and/or tool calls.
         """
-        model = self._resolve_model(model or self.default_model)
+        model = model or self.default_model
+        if model == self.default_model:
+            model = self._resolved_default_model
+        else:
+            model = self._resolve_model(model)
         
         # Clamp max_tokens to at least 1 — negative or zero values cause
         # LiteLLM to reject the request with "max_tokens must be at least 1".
@@ -3,18 +3,49 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import json
+import time
 from typing import Any, AsyncGenerator
 
 import httpx
 from loguru import logger
 
-from oauth_cli_kit import get_token as get_codex_token
+from oauth_cli_kit import OAuthToken, get_token as get_codex_token
 from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from nanobot.utils.helpers import json_loads
 
 DEFAULT_CODEX_URL = "https://chatgpt.com/backend-api/codex/responses"
 DEFAULT_ORIGINATOR = "nanobot"
+TOKEN_MIN_TTL_MS = 120_000  # Go back to disk (and refresh) once the token is this close to expiry
+
+# Shared connection pools, keyed by TLS verification mode (set per client, not per request)
+_CLIENTS: dict[bool, httpx.AsyncClient] = {}
+_http_version_logged = False  # Log the negotiated protocol (HTTP/2 check) once per process
+
+
+def _get_client(verify: bool = True) -> httpx.AsyncClient:
+    """Return the pooled client for Codex requests, creating it on first use."""
+    client = _CLIENTS.get(verify)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            # Keep idle connections long enough to survive tool execution between agent turns
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0),
+            verify=verify,
+            http2=True,
+        )
+        _CLIENTS[verify] = client
+    return client
+
+
+async def aclose() -> None:
+    """Close the pooled Codex clients (call on application shutdown)."""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
 
 
 class OpenAICodexProvider(LLMProvider):
@@ -23,6 +54,8 @@ class OpenAICodexProvider(LLMProvider):
     def __init__(self, default_model: str = "openai-codex/gpt-5.1-codex"):
         super().__init__(api_key=None, api_base=None)
         self.default_model = default_model
+        self._token: OAuthToken | None = None
+        self._token_lock = asyncio.Lock()
 
     async def chat(
         self,
@@ -35,8 +68,7 @@ class OpenAICodexProvider(LLMProvider):
         model = model or self.default_model
         system_prompt, input_items = _convert_messages(messages)
 
-        token = await asyncio.to_thread(get_codex_token)
-        headers = _build_headers(token.account_id, token.access)
+        token = await self._get_token()
 
         body: dict[str, Any] = {
             "model": _strip_model_prefix(model),
@@ -58,12 +90,12 @@ class OpenAICodexProvider(LLMProvider):
 
         try:
             try:
-                content, tool_calls, finish_reason = await _request_codex(url, headers, body, verify=True)
+                content, tool_calls, finish_reason = await self._request(url, body, token, verify=True)
             except Exception as e:
                 if "CERTIFICATE_VERIFY_FAILED" not in str(e):
                     raise
                 logger.warning("SSL certificate verification failed for Codex API; retrying with verify=False")
-                content, tool_calls, finish_reason = await _request_codex(url, headers, body, verify=False)
+                content, tool_calls, finish_reason = await self._request(url, body, token, verify=False)
             return LLMResponse(
                 content=content,
                 tool_calls=tool_calls,
@@ -78,6 +110,50 @@ class OpenAICodexProvider(LLMProvider):
     def get_default_model(self) -> str:
         return self.default_model
 
+    async def _request(
+        self,
+        url: str,
+        body: dict[str, Any],
+        token: OAuthToken,
+        verify: bool,
+    ) -> tuple[str, list[ToolCallRequest], str]:
+        try:
+            return await _request_codex(url, _build_headers(token.account_id, token.access), body, verify)
+        except _CodexAuthError:
+            # The cached token was revoked or replaced by a new login: reload it once and retry
+            logger.warning("Codex rejected the cached token; reloading it and retrying")
+            token = await self._reload_token(token)
+            return await _request_codex(url, _build_headers(token.account_id, token.access), body, verify)
+
+    async def _get_token(self) -> OAuthToken:
+        """Return the in-memory token, loading (and refreshing) from disk only near expiry."""
+        token = self._token
+        if token and _is_token_fresh(token):
+            return token
+        # Single-flight: concurrent callers wait for one load/refresh instead of racing
+        async with self._token_lock:
+            token = self._token
+            if not (token and _is_token_fresh(token)):
+                token = await asyncio.to_thread(get_codex_token, min_ttl_seconds=TOKEN_MIN_TTL_MS // 1000)
+                self._token = token
+        return token
+
+    async def _reload_token(self, rejected: OAuthToken) -> OAuthToken:
+        """Drop a token the API rejected and load the current one from disk."""
+        async with self._token_lock:
+            # Another caller may already have replaced the rejected token
+            if self._token is None or self._token is rejected:
+                self._token = await asyncio.to_thread(get_codex_token, min_ttl_seconds=TOKEN_MIN_TTL_MS // 1000)
+            return self._token
+
+
+class _CodexAuthError(RuntimeError):
+    """Raised when the Codex API rejects the access token (HTTP 401)."""
+
+
+def _is_token_fresh(token: OAuthToken) -> bool:
+    return token.expires - int(time.time() * 1000) > TOKEN_MIN_TTL_MS
+
 
 def _strip_model_prefix(model: str) -> str:
     if model.startswith("openai-codex/"):
@@ -85,7 +161,9 @@ def _strip_model_prefix(model: str) -> str:
     return model
 
 
+@functools.lru_cache(maxsize=4)
 def _build_headers(account_id: str, token: str) -> dict[str, str]:
+    # Memoized per token; callers must treat the returned dict as read-only.
     return {
         "Authorization": f"Bearer {token}",
         "chatgpt-account-id": account_id,
@@ -103,12 +181,19 @@ async def _request_codex(
     body: dict[str, Any],
     verify: bool,
 ) -> tuple[str, list[ToolCallRequest], str]:
-    async with httpx.AsyncClient(timeout=60.0, verify=verify) as client:
-        async with client.stream("POST", url, headers=headers, json=body) as response:
-            if response.status_code != 200:
-                text = await response.aread()
-                raise RuntimeError(_friendly_error(response.status_code, text.decode("utf-8", "ignore")))
-            return await _consume_sse(response)
+    global _http_version_logged
+    client = _get_client(verify)
+    async with client.stream("POST", url, headers=headers, json=body) as response:
+        if not _http_version_logged:
+            _http_version_logged = True
+            logger.debug(f"Codex connection negotiated {response.http_version}")
+        if response.status_code != 200:
+            text = await response.aread()
+            message = _friendly_error(response.status_code, text.decode("utf-8", "ignore"))
+            if response.status_code == 401:
+                raise _CodexAuthError(message)
+            raise RuntimeError(message)
+        return await _consume_sse(response)
 
 
 def _convert_tools(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -235,7 +320,7 @@ async def _iter_sse(response: httpx.Response) -> AsyncGenerator[dict[str, Any],
                 if not data or data == "[DONE]":
                     continue
                 try:
-                    yield json.loads(data)
+                    yield json_loads(data)
                 except Exception:
                     continue
             continue
@@ -280,7 +365,7 @@ async def _consume_sse(response: httpx.Response) -> tuple[str, list[ToolCallRequ
                 buf = tool_call_buffers.get(call_id) or {}
                 args_raw = buf.get("arguments") or item.get("arguments") or "{}"
                 try:
-                    args = json.loads(args_raw)
+                    args = json_loads(args_raw)
                 except Exception:
                     args = {"raw": args_raw}
                 tool_calls.append(
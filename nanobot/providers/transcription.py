@@ -1,5 +1,6 @@
 """Voice transcription provider using Groq."""
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any
@@ -18,6 +19,30 @@ class GroqTranscriptionProvider:
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
         self.api_url = "https://api.groq.com/openai/v1/audio/transcriptions"
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._client: httpx.AsyncClient | None = None
+    
+    async def __aenter__(self) -> "GroqTranscriptionProvider":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
     
     async def transcribe(self, file_path: str | Path) -> str:
         """
@@ -33,33 +58,31 @@ class GroqTranscriptionProvider:
             logger.warning("Groq API key not configured for transcription")
             return ""
         
-        path = Path(file_path)
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
         if not path.exists():
             logger.error(f"Audio file not found: {file_path}")
             return ""
         
         try:
-            async with httpx.AsyncClient() as client:
-                with open(path, "rb") as f:
-                    files = {
-                        "file": (path.name, f),
-                        "model": (None, "whisper-large-v3"),
-                    }
-                    headers = {
-                        "Authorization": f"Bearer {self.api_key}",
-                    }
-                    
-                    response = await client.post(
-                        self.api_url,
-                        headers=headers,
-                        files=files,
-                        timeout=60.0
-                    )
-                    
-                    response.raise_for_status()
-                    data = response.json()
-                    return data.get("text", "")
-                    
+            client = self._get_client()
+            # Read off the event loop so a slow disk doesn't stall other tasks
+            audio = await asyncio.to_thread(path.read_bytes)
+            files = {
+                "file": (path.name, audio),
+                "model": (None, "whisper-large-v3"),
+            }
+            
+            response = await client.post(
+                self.api_url,
+                headers=self._headers,
+                files=files,
+                timeout=60.0
+            )
+            
+            response.raise_for_status()
+            data = response.json()
+            return data.get("text", "")
+            
         except Exception as e:
             logger.error(f"Groq transcription error: {e}")
             return ""
@@ -8,7 +8,7 @@ from typing import Any
 
 from loguru import logger
 
-from nanobot.utils.helpers import ensure_dir, safe_filename
+from nanobot.utils.helpers import ensure_dir, json_loads, safe_filename
 
 
 @dataclass
@@ -121,20 +121,18 @@ class SessionManager:
             created_at = None
             last_consolidated = 0
 
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+            for line in path.read_bytes().splitlines():
+                if not line.strip():
+                    continue
 
-                    data = json.loads(line)
+                data = json_loads(line)
 
-                    if data.get("_type") == "metadata":
-                        metadata = data.get("metadata", {})
-                        created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-                        last_consolidated = data.get("last_consolidated", 0)
-                    else:
-                        messages.append(data)
+                if data.get("_type") == "metadata":
+                    metadata = data.get("metadata", {})
+                    created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
+                    last_consolidated = data.get("last_consolidated", 0)
+                else:
+                    messages.append(data)
 
             return Session(
                 key=key,
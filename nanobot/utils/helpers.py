@@ -1,7 +1,15 @@
 """Utility functions for nanobot."""
 
+import json
+import random
 from pathlib import Path
 from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def ensure_dir(path: Path) -> Path:
@@ -48,6 +56,32 @@ def timestamp() -> str:
     return datetime.now().isoformat()
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson when it is installed, falling back to the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects input the stdlib writes and accepts (lone surrogates, NaN)
+            pass
+    return json.loads(data)
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 60.0) -> float:
+    """
+    Full-jitter exponential backoff delay in seconds.
+    
+    Args:
+        attempt: Number of consecutive failures so far (0 for the first retry).
+        base: Base delay in seconds.
+        cap: Upper bound for the delay window.
+    
+    Returns:
+        A random delay in [0, min(cap, base * 2**attempt)].
+    """
+    return random.uniform(0, min(cap, base * (2 ** min(attempt, 5))))
+
+
 def truncate_string(s: str, max_len: int = 100, suffix: str = "...") -> str:
     """Truncate a string to max length, adding suffix if truncated."""
     if len(s) <= max_len:
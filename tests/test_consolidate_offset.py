@@ -166,6 +166,17 @@ class TestSessionPersistence:
         assert history[0]["content"] == "msg20"
         assert history[-1]["content"] == "msg29"
 
+    def test_persistence_roundtrip_lone_surrogate(self, tmp_path):
+        """Test that content the stdlib writes (lone surrogates) loads back intact."""
+        session1 = Session(key="test:surrogate")
+        session1.add_message("user", "hi")
+        session1.add_message("assistant", "broken emoji \ud83d")
+        SessionManager(Path(tmp_path)).save(session1)
+
+        session2 = SessionManager(Path(tmp_path)).get_or_create("test:surrogate")
+        assert len(session2.messages) == 2
+        assert session2.messages[-1]["content"] == "broken emoji \ud83d"
+
     def test_clear_resets_session(self, temp_manager):
         """Test that clear() properly resets session."""
         session = create_session_with_messages("test:clear", 10)
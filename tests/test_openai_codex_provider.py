@@ -0,0 +1,133 @@
+import asyncio
+import json
+import time
+
+import httpx
+from oauth_cli_kit import OAuthToken
+
+from nanobot.providers import openai_codex_provider
+from nanobot.providers.openai_codex_provider import OpenAICodexProvider
+
+
+def _token(ttl_s: int) -> OAuthToken:
+    return OAuthToken(
+        access="access",
+        refresh="refresh",
+        expires=int(time.time() * 1000) + ttl_s * 1000,
+        account_id="acct",
+    )
+
+
+def _counting_loader(monkeypatch, ttl_s: int) -> list[int]:
+    calls: list[int] = []
+
+    def fake_get_token(**kwargs) -> OAuthToken:
+        calls.append(1)
+        time.sleep(0.01)  # Give concurrent callers a chance to pile up
+        return _token(ttl_s)
+
+    monkeypatch.setattr(openai_codex_provider, "get_codex_token", fake_get_token)
+    return calls
+
+
+async def test_token_is_reused_while_fresh(monkeypatch) -> None:
+    calls = _counting_loader(monkeypatch, ttl_s=3600)
+    provider = OpenAICodexProvider()
+
+    first = await provider._get_token()
+    second = await provider._get_token()
+
+    assert first is second
+    assert len(calls) == 1
+
+
+async def test_token_is_reloaded_near_expiry(monkeypatch) -> None:
+    calls = _counting_loader(monkeypatch, ttl_s=3600)
+    provider = OpenAICodexProvider()
+    provider._token = _token(ttl_s=30)
+
+    token = await provider._get_token()
+
+    assert len(calls) == 1
+    assert token is provider._token
+
+
+async def test_reload_refreshes_within_our_expiry_margin(monkeypatch) -> None:
+    on_disk = _token(ttl_s=90)  # Stale for us (< 120 s) but fine by the loader's default 60 s
+    calls: list[int] = []
+
+    def fake_get_token(min_ttl_seconds: int = 60) -> OAuthToken:
+        # Mirrors oauth_cli_kit: only refreshes when the stored token is inside min_ttl_seconds
+        calls.append(min_ttl_seconds)
+        return _token(ttl_s=3600) if min_ttl_seconds > 90 else on_disk
+
+    monkeypatch.setattr(openai_codex_provider, "get_codex_token", fake_get_token)
+    provider = OpenAICodexProvider()
+    provider._token = on_disk
+
+    first = await provider._get_token()
+    second = await provider._get_token()
+
+    assert first is second and first is not on_disk
+    assert calls == [openai_codex_provider.TOKEN_MIN_TTL_MS // 1000]
+
+
+async def test_concurrent_callers_share_one_load(monkeypatch) -> None:
+    calls = _counting_loader(monkeypatch, ttl_s=3600)
+    provider = OpenAICodexProvider()
+
+    tokens = await asyncio.gather(*(provider._get_token() for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(t is tokens[0] for t in tokens)
+
+
+async def test_rejected_token_is_reloaded_and_retried(monkeypatch) -> None:
+    old, new = _token(ttl_s=3600), _token(ttl_s=3600)
+    new.access = "new-access"
+    loads = [new]
+    monkeypatch.setattr(openai_codex_provider, "get_codex_token", lambda **kwargs: loads.pop(0))
+
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        if request.headers["Authorization"] != "Bearer new-access":
+            return httpx.Response(401, text="token revoked")
+        return _sse(
+            {"type": "response.output_text.delta", "delta": "hello"},
+            {"type": "response.completed", "response": {"status": "completed"}},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(openai_codex_provider, "_get_client", lambda verify=True: client)
+    provider = OpenAICodexProvider()
+    provider._token = old
+
+    response = await provider.chat([{"role": "user", "content": "hi"}])
+    await client.aclose()
+
+    assert response.content == "hello"
+    assert seen == ["Bearer access", "Bearer new-access"]
+    assert provider._token is new
+    assert loads == []
+
+
+def _sse(*events: dict) -> httpx.Response:
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+    return httpx.Response(200, content=body.encode())
+
+
+async def test_tool_arguments_accept_lone_surrogate() -> None:
+    args = json.dumps({"text": "broken emoji \ud83d"})
+    response = _sse(
+        {"type": "response.output_item.added",
+         "item": {"type": "function_call", "call_id": "c1", "id": "fc_1", "name": "echo"}},
+        {"type": "response.function_call_arguments.done", "call_id": "c1", "arguments": args},
+        {"type": "response.output_item.done", "item": {"type": "function_call", "call_id": "c1"}},
+        {"type": "response.completed", "response": {"status": "completed"}},
+    )
+
+    _, tool_calls, _ = await openai_codex_provider._consume_sse(response)
+
+    assert tool_calls[0].arguments == {"text": "broken emoji \ud83d"}
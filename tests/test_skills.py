@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+from nanobot.agent.skills import SkillsLoader
+
+
+def _write_skill(root: Path, name: str, body: str) -> Path:
+    skill_file = root / "skills" / name / "SKILL.md"
+    skill_file.parent.mkdir(parents=True, exist_ok=True)
+    skill_file.write_text(body, encoding="utf-8")
+    return skill_file
+
+
+def test_load_skill_reuses_content_until_file_changes(tmp_path, monkeypatch) -> None:
+    skill_file = _write_skill(tmp_path, "demo", "v1")
+    loader = SkillsLoader(tmp_path, builtin_skills_dir=tmp_path / "builtin")
+
+    assert loader.load_skill("demo") == "v1"
+
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert loader.load_skill("demo") == "v1"
+    assert reads == []
+
+    skill_file.write_text("v1 edited", encoding="utf-8")
+    assert loader.load_skill("demo") == "v1 edited"
+    assert reads == [skill_file]
+
+
+def test_load_skill_sees_edit_that_keeps_mtime(tmp_path) -> None:
+    skill_file = _write_skill(tmp_path, "demo", "v1")
+    loader = SkillsLoader(tmp_path, builtin_skills_dir=tmp_path / "builtin")
+    assert loader.load_skill("demo") == "v1"
+
+    # Simulate an edit within the filesystem's mtime granularity
+    stat = skill_file.stat()
+    skill_file.write_text("v1 edited", encoding="utf-8")
+    os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert skill_file.stat().st_mtime_ns == stat.st_mtime_ns
+
+    assert loader.load_skill("demo") == "v1 edited"
+
+
+def test_load_skill_prefers_workspace_over_builtin(tmp_path) -> None:
+    _write_skill(tmp_path / "ws", "demo", "workspace")
+    _write_skill(tmp_path / "bi", "demo", "builtin")
+    _write_skill(tmp_path / "bi", "other", "builtin-only")
+    loader = SkillsLoader(tmp_path / "ws", builtin_skills_dir=tmp_path / "bi" / "skills")
+
+    assert loader.load_skill("demo") == "workspace"
+    assert loader.load_skill("other") == "builtin-only"
+    assert loader.load_skill("missing") is None
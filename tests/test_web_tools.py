@@ -0,0 +1,114 @@
+import functools
+import json
+
+import httpx
+import pytest
+
+from nanobot.agent.tools import web
+from nanobot.agent.tools.web import WebFetchTool, WebSearchTool
+
+
+class _Recorder:
+    """MockTransport handler that logs requests and replays a canned response."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.response = httpx.Response(200, json={})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.response
+
+
+@pytest.fixture
+async def mock_http(monkeypatch):
+    # Route the real pooled client (same limits, redirects and cookie policy) to a MockTransport
+    recorder = _Recorder()
+    monkeypatch.setattr(
+        httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(recorder))
+    )
+    monkeypatch.setattr(web, "_client", None)
+    yield recorder
+    await web.aclose()
+
+
+def _brave_results(*titles: str) -> httpx.Response:
+    results = [{"title": t, "url": f"https://example.com/{t}", "description": t} for t in titles]
+    return httpx.Response(200, json={"web": {"results": results}})
+
+
+async def test_search_formats_results(mock_http) -> None:
+    mock_http.response = _brave_results("alpha", "beta")
+    tool = WebSearchTool(api_key="key")
+
+    result = await tool.execute(query="nanobot", count=2)
+
+    assert "1. alpha" in result and "2. beta" in result
+    request = mock_http.requests[0]
+    assert request.url.params["q"] == "nanobot"
+    assert request.headers["X-Subscription-Token"] == "key"
+
+
+async def test_search_repeat_is_served_from_cache(mock_http) -> None:
+    mock_http.response = _brave_results("alpha")
+    tool = WebSearchTool(api_key="key")
+
+    first = await tool.execute(query="nanobot", count=1)
+    second = await tool.execute(query="nanobot", count=1)
+    await tool.execute(query="nanobot", count=2)
+
+    assert first == second
+    assert len(mock_http.requests) == 2
+
+
+async def test_search_cache_expires(mock_http, monkeypatch) -> None:
+    mock_http.response = _brave_results("alpha")
+    tool = WebSearchTool(api_key="key")
+    now = [1000.0]
+    monkeypatch.setattr(web.time, "monotonic", lambda: now[0])
+
+    await tool.execute(query="nanobot", count=1)
+    now[0] += web.SEARCH_CACHE_TTL_S + 1
+    await tool.execute(query="nanobot", count=1)
+
+    assert len(mock_http.requests) == 2
+
+
+async def test_search_errors_are_not_cached(mock_http) -> None:
+    mock_http.response = httpx.Response(500)
+    tool = WebSearchTool(api_key="key")
+
+    assert (await tool.execute(query="nanobot")).startswith("Error:")
+    mock_http.response = _brave_results("alpha")
+    assert "1. alpha" in await tool.execute(query="nanobot")
+
+
+async def test_fetch_returns_json_body(mock_http) -> None:
+    mock_http.response = httpx.Response(200, json={"hello": "world"})
+    tool = WebFetchTool()
+
+    result = json.loads(await tool.execute(url="https://example.com/data"))
+
+    assert result["extractor"] == "json"
+    assert json.loads(result["text"]) == {"hello": "world"}
+    assert mock_http.requests[0].headers["User-Agent"] == web.USER_AGENT
+
+
+async def test_fetch_does_not_replay_cookies(mock_http) -> None:
+    mock_http.response = httpx.Response(
+        200, json={"ok": True}, headers={"Set-Cookie": "sid=userA; Path=/"}
+    )
+    tool = WebFetchTool()
+
+    await tool.execute(url="https://example.com/login")
+    await tool.execute(url="https://example.com/profile")
+
+    assert len(mock_http.requests) == 2
+    assert "cookie" not in mock_http.requests[1].headers
+
+
+async def test_fetch_rejects_non_http_url(mock_http) -> None:
+    result = json.loads(await WebFetchTool().execute(url="file:///etc/passwd"))
+
+    assert "URL validation failed" in result["error"]
+    assert mock_http.requests == []